@@ -265,6 +265,14 @@ _COO_FROM_LIST_ARRAY_TEST_CASES = [
                       3, 1],
         expected_dense_shape=[4, 2],
     ),
+    dict(
+        testcase_name="2d_ragged_with_nulls",
+        list_array=[None, [1, 2], None, [3]],
+        expected_coo=[1, 0,
+                      1, 1,
+                      3, 0],
+        expected_dense_shape=[4, 2],
+    ),
     dict(
         testcase_name="3d_ragged",
         list_array=[[["a", "b"], ["c"]], [[], ["d", "e"]]],
@@ -291,24 +291,44 @@ Status CooFromListArray(
   // row_splits[j] <= i < row_splits[j + 1]. And i - row_splits[j] is that
   // element's position in the sub-list, thus the coordinate.
 
-  // This vector stores the indices of the sub-lists at each level the last
-  // leaf value belongs to.
-  // Note that elements in this vector is non-decreasing as we go through the
-  // values in order. That's why it persists outside the loop and gets updated
-  // by lookup_and_update().
-  std::vector<size_t> current_owning_sublist_indices(
-      nested_row_splits.size(), 0);
-  for (size_t i = 0; i < values->length(); ++i) {
-    int64_t* current_coo = coo_flat + i * coo_length;
-    int32_t current_idx = i;
-    // The inner loop looks for the index in the belonging sub-list at each
-    // level.
-    for (int j = nested_row_splits.size() - 1; j >= 0; --j) {
-      const int32_t row_split_begin = lookup_and_update(
-          current_idx, nested_row_splits[j],
-          &current_owning_sublist_indices[j]);
-      current_coo[j] = current_idx - row_split_begin;
-      current_idx = current_owning_sublist_indices[j];
+  // Only computed in the 1-nested fast path below.
+  int32_t max_sub_list_length = 0;
+  if (coo_length == 2) {
+    // Fast path for 1-nested ListArrays (ListArray<primitive>): the values of
+    // the i-th sub-list are at [i, 0], [i, 1], ..., so the coordinates can be
+    // written by walking the row_splits once, without looking up the owning
+    // sub-list of each value. The same walk also finds the longest sub-list,
+    // which determines the dense shape.
+    const absl::Span<const int32_t> row_splits = nested_row_splits[1];
+    int64_t* current_coo = coo_flat;
+    for (size_t i = 0; i < row_splits.size() - 1; ++i) {
+      const int32_t sub_list_length = row_splits[i + 1] - row_splits[i];
+      max_sub_list_length = std::max(max_sub_list_length, sub_list_length);
+      for (int32_t j = 0; j < sub_list_length; ++j) {
+        *current_coo++ = i;
+        *current_coo++ = j;
+      }
+    }
+  } else {
+    // This vector stores the indices of the sub-lists at each level the last
+    // leaf value belongs to.
+    // Note that elements in this vector is non-decreasing as we go through the
+    // values in order. That's why it persists outside the loop and gets
+    // updated by lookup_and_update().
+    std::vector<size_t> current_owning_sublist_indices(
+        nested_row_splits.size(), 0);
+    for (size_t i = 0; i < values->length(); ++i) {
+      int64_t* current_coo = coo_flat + i * coo_length;
+      int32_t current_idx = i;
+      // The inner loop looks for the index in the belonging sub-list at each
+      // level.
+      for (int j = nested_row_splits.size() - 1; j >= 0; --j) {
+        const int32_t row_split_begin = lookup_and_update(
+            current_idx, nested_row_splits[j],
+            &current_owning_sublist_indices[j]);
+        current_coo[j] = current_idx - row_split_begin;
+        current_idx = current_owning_sublist_indices[j];
+      }
     }
   }
 
@@ -317,13 +337,18 @@ Status CooFromListArray(
   arrow::Int64Builder dense_shape_builder;
   TFX_BSL_RETURN_IF_ERROR(
       FromArrowStatus(dense_shape_builder.Reserve(coo_length)));
-  for (const absl::Span<const int32_t> row_splits : nested_row_splits) {
-    int32_t dimension_size = 0;
-    for (int i = 0; i < row_splits.size() - 1; ++i) {
-      dimension_size =
-          std::max(dimension_size, row_splits[i + 1] - row_splits[i]);
+  if (coo_length == 2) {
+    dense_shape_builder.UnsafeAppend(list_array->length());
+    dense_shape_builder.UnsafeAppend(max_sub_list_length);
+  } else {
+    for (const absl::Span<const int32_t> row_splits : nested_row_splits) {
+      int32_t dimension_size = 0;
+      for (int i = 0; i < row_splits.size() - 1; ++i) {
+        dimension_size =
+            std::max(dimension_size, row_splits[i + 1] - row_splits[i]);
+      }
+      dense_shape_builder.UnsafeAppend(dimension_size);
     }
-    dense_shape_builder.UnsafeAppend(dimension_size);
   }
 
   TFX_BSL_RETURN_IF_ERROR(
@@ -166,15 +166,21 @@ void DefineArrayUtilSubmodule(py::module arrow_module) {
           "nulls and empty lists are not distinguished in the COO form."),
       py::call_guard<py::gil_scoped_release>());
 
-  m.def("FillNullLists", [](const std::shared_ptr<arrow::Array>& list_array,
-                            const std::shared_ptr<arrow::Array>& fill_with) {
-    std::shared_ptr<arrow::Array> result;
-    Status s = FillNullLists(list_array, fill_with, &result);
-    if (!s.ok()) {
-      throw std::runtime_error(s.ToString());
-    }
-    return result;
-  });
+  m.def(
+      "FillNullLists",
+      [](const std::shared_ptr<arrow::Array>& list_array,
+         const std::shared_ptr<arrow::Array>& fill_with) {
+        std::shared_ptr<arrow::Array> result;
+        Status s = FillNullLists(list_array, fill_with, &result);
+        if (!s.ok()) {
+          throw std::runtime_error(s.ToString());
+        }
+        return result;
+      },
+      py::doc(
+          "Fills nulls in a `list_array` with `fill_with`. The type of "
+          "`fill_with` must equal to the value type of `list_array`."),
+      py::call_guard<py::gil_scoped_release>());
 }
 
 void DefineTableUtilSubmodule(pybind11::module arrow_module) {
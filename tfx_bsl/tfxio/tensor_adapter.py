@@ -13,20 +13,16 @@
 # limitations under the License.
 """TensorAdapter."""
 
-from __future__ import absolute_import
-from __future__ import division
-# Standard __future__ imports
-from __future__ import print_function
-
 import abc
 import collections
+import functools
+import operator
 
 import numpy as np
-import six
 from tfx_bsl.arrow import array_util
 from tfx_bsl.pyarrow_tf import pyarrow as pa
 from tfx_bsl.pyarrow_tf import tensorflow as tf
-from typing import Any, Dict, List, Text, Tuple, Union
+from typing import Any, Dict, List, Optional, Text, Tuple, Union
 
 from tensorflow_metadata.proto.v0 import schema_pb2
 
@@ -37,7 +33,15 @@ TensorAdapterConfig = collections.namedtuple(
     [
         "arrow_schema",  # type is pa.Schema
         "tensor_representations",  # type is TensorRepresentations
+        # type is Optional[int]. If set, ToBatchTensorsInto() reuses output
+        # buffers that fit batches of up to this many rows.
+        "max_batch_size",
     ])
+TensorAdapterConfig.__new__.__defaults__ = (None,)
+# Maps column names to the nest depth and innermost value type of the columns
+# (see _GetNestDepthAndValueType()). Names shared by more than one column are
+# left out, as such columns can not be told apart by name.
+_FieldInfo = Dict[Text, Tuple[int, pa.DataType]]
 
 
 class TensorAdapter(object):
@@ -56,12 +60,21 @@ class TensorAdapter(object):
   unknown (None) because it depends on the size of the RecordBatch passed to
   ToBatchTensors().
 
+  Whether ToBatchTensors() produces eager Tensors or numpy values (graph mode)
+  is determined by whether the TF eager mode is on when the TensorAdapter is
+  created.
+
   It is guaranteed that for any tensor_name in the given TensorRepresentations
   self.TypeSpecs()[tensor_name].is_compatible_with(
       self.ToBatchedTensors(...)[tensor_name])
+
+  If a max_batch_size is given in the config, ToBatchTensorsInto() can be used
+  in place of ToBatchTensors() to reduce allocations in high-throughput
+  callers.
   """
 
-  __slots__ = ["_arrow_schema", "_type_handlers", "_type_specs"]
+  __slots__ = ["_arrow_schema", "_type_handlers", "_type_specs",
+               "_get_tensor_fns", "_get_tensor_into_fns"]
 
   def __init__(self, config: TensorAdapterConfig):
     self._arrow_schema = config.arrow_schema
@@ -71,6 +84,26 @@ class TensorAdapter(object):
         tensor_name: handler.type_spec
         for tensor_name, handler in self._type_handlers
     }
+    # Bound GetTensor() methods, resolved once so that ToBatchTensors() does
+    # not look them up on every handler for every batch.
+    self._get_tensor_fns = tuple(
+        (tensor_name, handler.GetTensor)
+        for tensor_name, handler in self._type_handlers)
+    # Same as above, but with the reusable output buffers bound, for
+    # ToBatchTensorsInto().
+    self._get_tensor_into_fns = self._get_tensor_fns
+    if config.max_batch_size is not None:
+      get_tensor_into_fns = []
+      for tensor_name, handler in self._type_handlers:
+        output_buffer = handler.MakeOutputBuffer(config.max_batch_size)
+        if output_buffer is None:
+          get_tensor_into_fns.append((tensor_name, handler.GetTensor))
+        else:
+          get_tensor_into_fns.append(
+              (tensor_name,
+               functools.partial(handler.GetTensor,
+                                 output_buffer=output_buffer)))
+      self._get_tensor_into_fns = tuple(get_tensor_into_fns)
 
   def TypeSpecs(self) -> Dict[Text, tf.TypeSpec]:
     """Returns the TypeSpec for each tensor."""
@@ -78,12 +111,36 @@ class TensorAdapter(object):
 
   def ToBatchTensors(self, record_batch: pa.RecordBatch) -> Dict[Text, Any]:
     """Returns a batch of tensors translated from record_batch."""
+    return self._ToBatchTensors(record_batch, {}, self._get_tensor_fns)
+
+  def ToBatchTensorsInto(self, record_batch: pa.RecordBatch,
+                         tensors: Dict[Text, Any]) -> Dict[Text, Any]:
+    """Like ToBatchTensors(), but reuses the output Dict and buffers.
+
+    In graph mode, the numpy values produced may be views of buffers that are
+    owned by this TensorAdapter and will be overwritten by the next call, so
+    callers must consume (or copy) them before that.
+
+    Args:
+      record_batch: the RecordBatch to translate.
+      tensors: the Dict (usually the one returned by the previous call) to
+        store the tensors in. Existing entries of the same names are replaced.
+
+    Returns:
+      `tensors`.
+    """
+    return self._ToBatchTensors(record_batch, tensors,
+                                self._get_tensor_into_fns)
+
+  def _ToBatchTensors(self, record_batch: pa.RecordBatch,
+                      result: Dict[Text, Any],
+                      get_tensor_fns: Tuple[Tuple[Text, Any], ...]
+                     ) -> Dict[Text, Any]:
     if not record_batch.schema.equals(self._arrow_schema):
       raise ValueError("Expected same schema.")
-    result = {}
-    for tensor_name, handler in self._type_handlers:
+    for tensor_name, get_tensor in get_tensor_fns:
       try:
-        result[tensor_name] = handler.GetTensor(record_batch)
+        result[tensor_name] = get_tensor(record_batch)
       except Exception as e:
         raise ValueError("Error raised when handling tensor {}: {}"
                          .format(tensor_name, e))
@@ -91,8 +148,7 @@ class TensorAdapter(object):
     return result
 
 
-@six.add_metaclass(abc.ABCMeta)
-class _TypeHandler(object):
+class _TypeHandler(abc.ABC):
   """Base class of all type handlers.
 
   A TypeHandler converts one or more columns in a RecordBatch to a TF Tensor
@@ -136,21 +192,45 @@ class _TypeHandler(object):
 
     Returns:
       A Tensor or a CompositeTensor. Note that their types may vary depending
-      on whether the TF eager mode is on.
+      on whether the TF eager mode was on when the handler was created.
     """
 
+  def MakeOutputBuffer(self, max_batch_size: int) -> Optional[np.ndarray]:
+    """Returns a buffer for GetTensor() to reuse, or None if not supported.
+
+    If a buffer is returned, GetTensor() also accepts it as an `output_buffer`
+    keyword argument, and may return views of it for batches of up to
+    `max_batch_size` rows.
+
+    Args:
+      max_batch_size: the maximum number of rows the buffer should fit.
+    """
+    del max_batch_size
+    return None
+
   @staticmethod
   @abc.abstractmethod
   def CanHandle(
       arrow_schema: pa.Schema,
-      tensor_representation: schema_pb2.TensorRepresentation) -> bool:
-    """Returns true if an instance of the handler can handle the combination."""
+      tensor_representation: schema_pb2.TensorRepresentation,
+      field_info: Optional[_FieldInfo] = None) -> bool:
+    """Returns true if an instance of the handler can handle the combination.
+
+    Args:
+      arrow_schema: the Arrow schema.
+      tensor_representation: the TensorRepresentation.
+      field_info: optional. If provided, it must be what _GetFieldInfo()
+        returns for `arrow_schema`, and will be used instead of looking up the
+        fields in `arrow_schema`.
+    """
 
 
 class _BaseDenseTensorHandler(_TypeHandler):
   """Base class of DenseTensorHandlers."""
 
-  __slots__ = ["_column_index", "_dtype", "_shape", "_unbatched_flat_len"]
+  __slots__ = ["_column_index", "_dtype", "_shape", "_unbatched_shape",
+               "_unbatched_flat_len", "_np_dtype", "_eager",
+               "_is_fixed_size_list", "_value_type"]
 
   def __init__(self, arrow_schema: pa.Schema,
                tensor_representation: schema_pb2.TensorRepresentation):
@@ -159,13 +239,19 @@ class _BaseDenseTensorHandler(_TypeHandler):
     dense_rep = tensor_representation.dense_tensor
     column_name = dense_rep.column_name
     self._column_index = arrow_schema.get_field_index(column_name)
-    _, value_type = _GetNestDepthAndValueType(arrow_schema[self._column_index])
+    arrow_field = arrow_schema[self._column_index]
+    self._is_fixed_size_list = _IsFixedSizeList(arrow_field.type)
+    value_type = _GetDenseValueType(arrow_field)
+    self._value_type = value_type
     self._dtype = _ArrowTypeToTfDtype(value_type)
+    self._np_dtype = _NumpyViewDtypeOrNone(value_type)
     unbatched_shape = [
         d.size for d in tensor_representation.dense_tensor.shape.dim
     ]
     self._shape = [None] + unbatched_shape
-    self._unbatched_flat_len = int(np.prod(unbatched_shape, initial=1))
+    self._unbatched_shape = tuple(unbatched_shape)
+    self._unbatched_flat_len = _NumElements(unbatched_shape)
+    self._eager = tf.executing_eagerly()
 
   @property
   def type_spec(self) -> tf.TypeSpec:
@@ -174,7 +260,9 @@ class _BaseDenseTensorHandler(_TypeHandler):
   def _ListArrayToTensor(
       self, list_array: pa.Array) -> Union[np.ndarray, tf.Tensor]:
     """Converts a ListArray to a dense tensor."""
-    values = list_array.flatten()
+    if self._is_fixed_size_list:
+      return self._FixedSizeListArrayToTensor(list_array)
+    values = _GetListArrayValues(list_array)
     batch_size = len(list_array)
     expected_num_elements = batch_size * self._unbatched_flat_len
     if len(values) != expected_num_elements:
@@ -182,24 +270,77 @@ class _BaseDenseTensorHandler(_TypeHandler):
           "Unable to convert ListArray {} to {}: size mismatch. expected {} "
           "elements but got {}".format(
               list_array, self.type_spec, expected_num_elements, len(values)))
-    # TODO(zhuo): Cast StringArrays to BinaryArrays before calling np.asarray()
-    # to avoid generating unicode objects which are wasteful to feed to
-    # TensorFlow, once pyarrow requirement is bumped to >=0.15.
-    actual_shape = list(self._shape)
-    actual_shape[0] = batch_size
-    values_np = np.asarray(values).reshape(actual_shape)
-    if tf.executing_eagerly():
-      return tf.convert_to_tensor(values_np)
+    if self._np_dtype is not None and values.null_count == 0:
+      values_np = _PrimitiveArrayToNumpy(values, self._np_dtype)
+    else:
+      # TODO(zhuo): Cast StringArrays to BinaryArrays before calling
+      # np.asarray() to avoid generating unicode objects which are wasteful to
+      # feed to TensorFlow, once pyarrow requirement is bumped to >=0.15.
+      values_np = np.asarray(values)
+    return self._NumpyToTensor(values_np, batch_size)
+
+  def _FixedSizeListArrayToTensor(
+      self, list_array: pa.Array) -> Union[np.ndarray, tf.Tensor]:
+    """Converts a FixedSizeListArray to a dense tensor.
+
+    BaseCanHandle() guarantees that the list size equals
+    self._unbatched_flat_len and that the values are numeric, so the value
+    slots can be viewed as they are.
+
+    Args:
+      list_array: a FixedSizeListArray.
+
+    Returns:
+      A dense tensor.
+    """
+    batch_size = len(list_array)
+    if list_array.null_count:
+      # Null lists have no element (as in ListArrays), so there can not be
+      # enough elements.
+      raise ValueError(
+          "Unable to convert FixedSizeListArray {} to {}: size mismatch. "
+          "expected {} elements but got {}".format(
+              list_array, self.type_spec,
+              batch_size * self._unbatched_flat_len,
+              (batch_size - list_array.null_count) *
+              self._unbatched_flat_len))
+    values = _GetFixedSizeListArrayValues(list_array)
+    if values.null_count == 0:
+      values_np = _PrimitiveArrayToNumpy(values, self._np_dtype)
+    else:
+      values_np = np.asarray(values)
+    return self._NumpyToTensor(values_np, batch_size)
+
+  def _NumpyToTensor(
+      self, values_np: np.ndarray,
+      batch_size: int) -> Union[np.ndarray, tf.Tensor]:
+    """Converts flattened values of a batch to a dense tensor."""
+    values_np = values_np.reshape((batch_size,) + self._unbatched_shape)
+    if self._eager:
+      return tf.constant(values_np, dtype=self._dtype)
 
     return values_np
 
   @staticmethod
   def BaseCanHandle(
       arrow_schema: pa.Schema,
-      tensor_representation: schema_pb2.TensorRepresentation) -> bool:
-    depth, value_type = _GetNestDepthAndValueType(
-        arrow_schema.field_by_name(
-            tensor_representation.dense_tensor.column_name))
+      tensor_representation: schema_pb2.TensorRepresentation,
+      field_info: Optional[_FieldInfo] = None) -> bool:
+    depth_and_value_type = _LookUpNestDepthAndValueType(
+        arrow_schema, tensor_representation.dense_tensor.column_name,
+        field_info)
+    if depth_and_value_type is None:
+      return False
+    depth, value_type = depth_and_value_type
+    # A FixedSizeList is not a list as far as _GetNestDepthAndValueType() is
+    # concerned, so it comes back as a 0-nested value type.
+    if depth == 0 and _IsFixedSizeList(value_type):
+      # Can only handle FixedSizeLists of numbers (they are converted
+      # copy-free) whose size matches the shape.
+      unbatched_flat_len = _NumElements(
+          [d.size for d in tensor_representation.dense_tensor.shape.dim])
+      return (_IsNumericArrowValueType(value_type.value_type) and
+              value_type.list_size == unbatched_flat_len)
     # Can only handle 1-nested lists.
     return depth == 1 and _IsSupportedArrowValueType(value_type)
 
@@ -216,45 +357,151 @@ class _DenseTensorHandler(_BaseDenseTensorHandler):
 
   @staticmethod
   def CanHandle(arrow_schema: pa.Schema,
-                tensor_representation: schema_pb2.TensorRepresentation) -> bool:
+                tensor_representation: schema_pb2.TensorRepresentation,
+                field_info: Optional[_FieldInfo] = None) -> bool:
     return (_BaseDenseTensorHandler.BaseCanHandle(arrow_schema,
-                                                  tensor_representation) and
+                                                  tensor_representation,
+                                                  field_info) and
             not tensor_representation.dense_tensor.HasField("default_value"))
 
 
 class _DefaultFillingDenseTensorHandler(_BaseDenseTensorHandler):
   """Handles conversion to dense with default filling."""
 
-  __slots__ = ["_default_fill"]
+  __slots__ = ["_default_fill", "_default_fill_np"]
 
   def __init__(self, arrow_schema: pa.Schema,
                tensor_representation: schema_pb2.TensorRepresentation):
     super(_DefaultFillingDenseTensorHandler, self).__init__(
         arrow_schema, tensor_representation)
-    _, value_type = _GetNestDepthAndValueType(arrow_schema[self._column_index])
     self._default_fill = _GetDefaultFill(
-        self._shape[1:], value_type,
+        self._shape[1:], self._value_type,
         tensor_representation.dense_tensor.default_value)
+    self._default_fill_np = None
+    if self._np_dtype is not None:
+      self._default_fill_np = _PrimitiveArrayToNumpy(
+          self._default_fill, self._np_dtype)
+
+  def MakeOutputBuffer(self, max_batch_size: int) -> Optional[np.ndarray]:
+    # Only null filling for numeric values (see GetTensor()) writes into a
+    # buffer that the handler allocates.
+    if self._np_dtype is None:
+      return None
+    return np.empty((max_batch_size, self._unbatched_flat_len),
+                    dtype=self._np_dtype)
 
   def GetTensor(
-      self, record_batch: pa.RecordBatch) -> Union[np.ndarray, tf.Tensor]:
+      self, record_batch: pa.RecordBatch,
+      output_buffer: Optional[np.ndarray] = None
+  ) -> Union[np.ndarray, tf.Tensor]:
     column = record_batch.column(self._column_index)
+    if column.null_count == 0:
+      return self._ListArrayToTensor(column)
+    if self._is_fixed_size_list:
+      return self._NumpyToTensor(
+          self._FillNullFixedSizeLists(column, output_buffer), len(column))
+    if self._default_fill_np is not None:
+      values = _GetListArrayValues(column)
+      batch_size = len(column)
+      num_non_null = batch_size - column.null_count
+      # Otherwise let _ListArrayToTensor() handle (and raise on) it.
+      if (values.null_count == 0 and
+          len(values) == num_non_null * self._unbatched_flat_len):
+        return self._NumpyToTensor(
+            self._FillNullLists(column, values, num_non_null, output_buffer),
+            batch_size)
     column = array_util.FillNullLists(column, self._default_fill)
     return self._ListArrayToTensor(column)
 
+  def _GetFillingResultBuffer(
+      self, batch_size: int,
+      output_buffer: Optional[np.ndarray]) -> np.ndarray:
+    """Returns a [batch_size, flat_len] array, in output_buffer if it fits."""
+    if output_buffer is not None and batch_size <= len(output_buffer):
+      return output_buffer[:batch_size]
+    return np.empty((batch_size, self._unbatched_flat_len),
+                    dtype=self._np_dtype)
+
+  def _FillNullLists(self, list_array: pa.Array, values: pa.Array,
+                     num_non_null: int,
+                     output_buffer: Optional[np.ndarray]) -> np.ndarray:
+    """Returns the values of `list_array` with null lists filled, in numpy.
+
+    Unlike array_util.FillNullLists(), this writes the non-null lists and the
+    default fills directly into one numpy array, instead of concatenating
+    Arrow fragments.
+
+    Args:
+      list_array: a ListArray whose non-null lists contain exactly
+        self._unbatched_flat_len elements each.
+      values: _GetListArrayValues(list_array). Must not contain nulls.
+      num_non_null: the number of non-null lists in `list_array`.
+      output_buffer: if not None, a buffer from MakeOutputBuffer() to write
+        the result into.
+
+    Returns:
+      A numpy array of shape [len(list_array), self._unbatched_flat_len].
+    """
+    is_null = array_util.GetArrayNullBitmapAsByteArray(
+        list_array).to_numpy().view(np.bool_)
+    result = self._GetFillingResultBuffer(len(list_array), output_buffer)
+    result[is_null] = self._default_fill_np
+    result[~is_null] = _PrimitiveArrayToNumpy(values, self._np_dtype).reshape(
+        (num_non_null, self._unbatched_flat_len))
+    return result
+
+  def _FillNullFixedSizeLists(
+      self, list_array: pa.Array,
+      output_buffer: Optional[np.ndarray]) -> np.ndarray:
+    """Like _FillNullLists() but for a FixedSizeListArray.
+
+    The value slots of the null lists are overwritten in a copy of all the
+    value slots of `list_array`.
+
+    Args:
+      list_array: a FixedSizeListArray.
+      output_buffer: if not None, a buffer from MakeOutputBuffer() to write
+        the result into.
+
+    Returns:
+      A numpy array of shape [len(list_array), self._unbatched_flat_len].
+
+    Raises:
+      ValueError: if any of the non-null lists contains a null.
+    """
+    is_null = array_util.GetArrayNullBitmapAsByteArray(
+        list_array).to_numpy().view(np.bool_)
+    values = _GetFixedSizeListArrayValues(list_array)
+    # Null values in the null lists get overwritten, but there is no default
+    # for those in the non-null lists.
+    if values.null_count:
+      is_null_value = array_util.GetArrayNullBitmapAsByteArray(
+          values).to_numpy().view(np.bool_).reshape(
+              (len(list_array), self._unbatched_flat_len))
+      if is_null_value[~is_null].any():
+        raise ValueError(
+            "Unable to convert FixedSizeListArray {} to {}: non-null lists "
+            "contain null values".format(list_array, self.type_spec))
+    result = self._GetFillingResultBuffer(len(list_array), output_buffer)
+    result[:] = _PrimitiveArrayToNumpy(values, self._np_dtype).reshape(
+        result.shape)
+    result[is_null] = self._default_fill_np
+    return result
+
   @staticmethod
   def CanHandle(arrow_schema: pa.Schema,
-                tensor_representation: schema_pb2.TensorRepresentation) -> bool:
+                tensor_representation: schema_pb2.TensorRepresentation,
+                field_info: Optional[_FieldInfo] = None) -> bool:
     return (
         _BaseDenseTensorHandler.BaseCanHandle(
-            arrow_schema, tensor_representation)
+            arrow_schema, tensor_representation, field_info)
         and tensor_representation.dense_tensor.HasField("default_value"))
 
 
 class _VarLenSparseTensorHandler(_TypeHandler):
   """Handles conversion to varlen sparse."""
 
-  __slots__ = ["_column_index", "_dtype"]
+  __slots__ = ["_column_index", "_dtype", "_np_dtype", "_eager"]
 
   def __init__(self, arrow_schema: pa.Schema,
                tensor_representation: schema_pb2.TensorRepresentation):
@@ -264,6 +511,8 @@ class _VarLenSparseTensorHandler(_TypeHandler):
     self._column_index = arrow_schema.get_field_index(column_name)
     _, value_type = _GetNestDepthAndValueType(arrow_schema[self._column_index])
     self._dtype = _ArrowTypeToTfDtype(value_type)
+    self._np_dtype = _NumpyViewDtypeOrNone(value_type)
+    self._eager = tf.executing_eagerly()
 
   @property
   def type_spec(self) -> tf.TypeSpec:
@@ -273,24 +522,34 @@ class _VarLenSparseTensorHandler(_TypeHandler):
   def GetTensor(self, record_batch: pa.RecordBatch) -> Any:
     array = record_batch.column(self._column_index)
     coo_array, dense_shape_array = array_util.CooFromListArray(array)
-    dense_shape_np = dense_shape_array.to_numpy()
-    values_np = np.asarray(array.flatten())
-    coo_np = coo_array.to_numpy().reshape(values_np.size, 2)
+    # Both arrays are Int64Arrays without nulls.
+    dense_shape_np = _PrimitiveArrayToNumpy(dense_shape_array, _INT64_NP_DTYPE)
+    values = array.flatten()
+    if self._np_dtype is not None and values.null_count == 0:
+      values_np = _PrimitiveArrayToNumpy(values, self._np_dtype)
+    else:
+      values_np = np.asarray(values)
+    coo_np = _PrimitiveArrayToNumpy(coo_array, _INT64_NP_DTYPE).reshape(
+        values_np.size, 2)
 
-    if tf.executing_eagerly():
+    if self._eager:
+      # SparseTensor converts the indices and dense_shape to int64 itself.
       return tf.sparse.SparseTensor(
-          indices=tf.convert_to_tensor(coo_np),
-          dense_shape=tf.convert_to_tensor(dense_shape_np),
-          values=tf.convert_to_tensor(values_np))
+          indices=coo_np, dense_shape=dense_shape_np,
+          values=tf.constant(values_np, dtype=self._dtype))
     return tf.compat.v1.SparseTensorValue(
         indices=coo_np, dense_shape=dense_shape_np, values=values_np)
 
   @staticmethod
   def CanHandle(arrow_schema: pa.Schema,
-                tensor_representation: schema_pb2.TensorRepresentation) -> bool:
-    depth, value_type = _GetNestDepthAndValueType(
-        arrow_schema.field_by_name(
-            tensor_representation.varlen_sparse_tensor.column_name))
+                tensor_representation: schema_pb2.TensorRepresentation,
+                field_info: Optional[_FieldInfo] = None) -> bool:
+    depth_and_value_type = _LookUpNestDepthAndValueType(
+        arrow_schema, tensor_representation.varlen_sparse_tensor.column_name,
+        field_info)
+    if depth_and_value_type is None:
+      return False
+    depth, value_type = depth_and_value_type
     # Currently can only handle 1-nested lists, but can easily support
     # arbitrarily nested ListArrays.
     return depth == 1 and _IsSupportedArrowValueType(value_type)
@@ -310,14 +569,15 @@ def _BuildTypeHandlers(
     arrow_schema: pa.Schema) -> List[Tuple[Text, _TypeHandler]]:
   """Builds type handlers according to TensorRepresentations."""
   result = []
-  for tensor_name, rep in six.iteritems(tensor_representations):
+  field_info = _GetFieldInfo(arrow_schema)
+  for tensor_name, rep in tensor_representations.items():
     potential_handlers = _TYPE_HANDLER_MAP.get(rep.WhichOneof("kind"))
     if not potential_handlers:
       raise ValueError("Unable to handle tensor {} with rep {}".format(
           tensor_name, rep))
     found_handler = False
     for h in potential_handlers:
-      if h.CanHandle(arrow_schema, rep):
+      if h.CanHandle(arrow_schema, rep, field_info):
         found_handler = True
         result.append((tensor_name, h(arrow_schema, rep)))
         break
@@ -341,18 +601,191 @@ def _GetNestDepthAndValueType(
   return depth, arrow_type
 
 
+def _NumElements(shape: List[int]) -> int:
+  """Returns the number of elements of a tensor of the given shape."""
+  # Shapes are short and a Python reduction is much cheaper than np.prod()
+  # on them.
+  return functools.reduce(operator.mul, shape, 1)
+
+
+def _GetFieldInfo(arrow_schema: pa.Schema) -> _FieldInfo:
+  """Returns the _FieldInfo of all the columns in arrow_schema."""
+  result = {}
+  duplicated_names = set()
+  for f in arrow_schema:
+    if f.name in result:
+      duplicated_names.add(f.name)
+    result[f.name] = _GetNestDepthAndValueType(f)
+  for name in duplicated_names:
+    del result[name]
+  return result
+
+
+def _LookUpNestDepthAndValueType(
+    arrow_schema: pa.Schema, column_name: Text,
+    field_info: Optional[_FieldInfo]
+) -> Optional[Tuple[int, pa.DataType]]:
+  """Returns _GetNestDepthAndValueType() of the named column.
+
+  Args:
+    arrow_schema: the Arrow schema.
+    column_name: name of the column.
+    field_info: optional. If provided, it must be _GetFieldInfo(arrow_schema).
+
+  Returns:
+    None if arrow_schema does not have exactly one column of the name.
+  """
+  if field_info is not None:
+    return field_info.get(column_name)
+  fields = [f for f in arrow_schema if f.name == column_name]
+  if len(fields) != 1:
+    return None
+  return _GetNestDepthAndValueType(fields[0])
+
+
+def _IsFixedSizeList(arrow_type: pa.DataType) -> bool:
+  # pa.types.is_fixed_size_list() is not available in pyarrow<0.16, in which
+  # FixedSizeListArrays can not be created from Python anyway.
+  is_fixed_size_list = getattr(pa.types, "is_fixed_size_list", None)
+  return is_fixed_size_list is not None and is_fixed_size_list(arrow_type)
+
+
+def _GetDenseValueType(arrow_field: pa.Field) -> pa.DataType:
+  """Returns the value type of a column that can be converted to dense."""
+  if _IsFixedSizeList(arrow_field.type):
+    return arrow_field.type.value_type
+  _, value_type = _GetNestDepthAndValueType(arrow_field)
+  return value_type
+
+
+# TODO(zhuo): Also support StringArrays, once pyarrow requirements
+# is >=0.15 which allows to cast a StringArray to BinaryArray copy-free.
+# TODO(zhuo): Support LargeListArray, LargeBinaryArray, LargeStringArray
+# once pyarrow requirements is >=0.15.
+_SUPPORTED_NUMERIC_VALUE_TYPES = [
+    pa.int8(), pa.int16(), pa.int32(), pa.int64(),
+    pa.uint8(), pa.uint16(), pa.uint32(), pa.uint64(),
+    pa.float16(), pa.float32(), pa.float64(),
+]
+_SUPPORTED_VALUE_TYPES = _SUPPORTED_NUMERIC_VALUE_TYPES + [pa.binary()]
+# The supported value types are all parameter-free, so their type ids are
+# sufficient to identify them.
+_NUMERIC_VALUE_TYPE_IDS = frozenset(
+    t.id for t in _SUPPORTED_NUMERIC_VALUE_TYPES)
+_SUPPORTED_VALUE_TYPE_IDS = frozenset(t.id for t in _SUPPORTED_VALUE_TYPES)
+_ARROW_TYPE_ID_TO_TF_DTYPE = {
+    t.id: tf.dtypes.as_dtype(t.to_pandas_dtype())
+    for t in _SUPPORTED_VALUE_TYPES
+}
+_ARROW_TYPE_ID_TO_NP_DTYPE = {
+    t.id: np.dtype(t.to_pandas_dtype()) for t in _SUPPORTED_VALUE_TYPES
+}
+_INT64_NP_DTYPE = np.dtype(np.int64)
+
+
 def _IsSupportedArrowValueType(arrow_type: pa.DataType) -> bool:
-  # TODO(zhuo): Also support StringArrays, once pyarrow requirements
-  # is >=0.15 which allows to cast a StringArray to BinaryArray copy-free.
-  # TODO(zhuo): Support LargeListArray, LargeBinaryArray, LargeStringArray
-  # once pyarrow requirements is >=0.15.
-  return (pa.types.is_integer(arrow_type) or
-          pa.types.is_floating(arrow_type) or
-          pa.types.is_binary(arrow_type))
+  return arrow_type.id in _SUPPORTED_VALUE_TYPE_IDS
+
+
+def _IsNumericArrowValueType(arrow_type: pa.DataType) -> bool:
+  """Returns true if arrow_type is a supported integer or floating type."""
+  return arrow_type.id in _NUMERIC_VALUE_TYPE_IDS
+
+
+def _NumpyViewDtypeOrNone(arrow_type: pa.DataType) -> Optional[np.dtype]:
+  """Returns the numpy dtype to view arrow_type values as, copy-free.
+
+  Args:
+    arrow_type: a supported Arrow value type.
+
+  Returns:
+    None if values of arrow_type can not be viewed as a numpy array.
+  """
+  if _IsNumericArrowValueType(arrow_type):
+    return _ArrowTypeToNpDtype(arrow_type)
+  return None
 
 
 def _ArrowTypeToTfDtype(arrow_type: pa.DataType) -> tf.DType:
-  return tf.dtypes.as_dtype(arrow_type.to_pandas_dtype())
+  return _ARROW_TYPE_ID_TO_TF_DTYPE[arrow_type.id]
+
+
+def _ArrowTypeToNpDtype(arrow_type: pa.DataType) -> np.dtype:
+  return _ARROW_TYPE_ID_TO_NP_DTYPE[arrow_type.id]
+
+
+def _PrimitiveArrayToNumpy(primitive_array: pa.Array,
+                           np_dtype: np.dtype) -> np.ndarray:
+  """Returns a numpy array that views the values of a primitive Array.
+
+  Unlike np.asarray(), this does not go through pyarrow's generic conversion.
+  The result shares memory with `primitive_array` and is read-only.
+
+  Args:
+    primitive_array: an integer or floating point Array that contains no null.
+    np_dtype: the numpy dtype equivalent to the type of `primitive_array`.
+
+  Returns:
+    A 1-D numpy array of len(primitive_array) elements.
+  """
+  num_elements = len(primitive_array)
+  if num_elements == 0:
+    return np.empty(0, dtype=np_dtype)
+  return np.frombuffer(
+      primitive_array.buffers()[1],
+      dtype=np_dtype,
+      count=num_elements,
+      offset=primitive_array.offset * np_dtype.itemsize)
+
+
+def _GetListArrayValues(list_array: pa.Array) -> pa.Array:
+  """Returns the values of the lists in a (possibly sliced) ListArray.
+
+  ListArray.flatten() in pyarrow<0.16 returns the whole child array, ignoring
+  the offset of `list_array` (and ListArray.values does so in all versions).
+  This instead slices the child array to the range spanned by the list
+  offsets of `list_array`. Unlike flatten() in newer pyarrow, values that back
+  null lists (if any) are included.
+
+  Args:
+    list_array: a ListArray.
+
+  Returns:
+    An Array of the values of the lists in `list_array`, in order.
+  """
+  # ListArray.values is not available in pyarrow<0.15, where flatten() returns
+  # the same thing.
+  child = getattr(list_array, "values", None)
+  if child is None:
+    child = list_array.flatten()
+  num_lists = len(list_array)
+  if num_lists == 0:
+    return child.slice(0, 0)
+  offsets = np.frombuffer(
+      list_array.buffers()[1], dtype=np.int32, count=num_lists + 1,
+      offset=list_array.offset * 4)
+  start = int(offsets[0])
+  return child.slice(start, int(offsets[-1]) - start)
+
+
+def _GetFixedSizeListArrayValues(list_array: pa.Array) -> pa.Array:
+  """Returns the value slots of a FixedSizeListArray.
+
+  Unlike flatten(), value slots of null lists are included (their contents
+  are unspecified), so the i-th list is always at
+  [i * list_size, (i + 1) * list_size).
+
+  Args:
+    list_array: a FixedSizeListArray.
+
+  Returns:
+    An Array of len(list_array) * list_size elements.
+  """
+  list_size = list_array.type.list_size
+  # FixedSizeListArray.values does not take the offset of `list_array` into
+  # account.
+  return list_array.values.slice(
+      list_array.offset * list_size, len(list_array) * list_size)
 
 
 def _GetAllowedDefaultValue(
@@ -363,7 +796,7 @@ def _GetAllowedDefaultValue(
   kind = default_value_proto.WhichOneof("kind")
   if kind in ("int_value", "uint_value") and pa.types.is_integer(value_type):
     value = getattr(default_value_proto, kind)
-    iinfo = np.iinfo(value_type.to_pandas_dtype())
+    iinfo = np.iinfo(_ArrowTypeToNpDtype(value_type))
     if value <= iinfo.max and value >= iinfo.min:
       return value
     else:
@@ -385,7 +818,15 @@ def _GetDefaultFill(
 ) -> pa.Array:
   """Returns an Array full of the default value given in the proto."""
 
-  size = int(np.prod(unbatched_shape, initial=1))
-  return pa.array([
-      _GetAllowedDefaultValue(value_type, default_value_proto)] * size,
-                  type=value_type)
+  size = _NumElements(unbatched_shape)
+  default_value = _GetAllowedDefaultValue(value_type, default_value_proto)
+  # Build the Array from its buffers, and not from a list of `size` Python
+  # objects.
+  if pa.types.is_binary(value_type):
+    offsets = np.arange(size + 1, dtype=np.int32) * len(default_value)
+    return pa.Array.from_buffers(
+        value_type, size,
+        [None, pa.py_buffer(offsets), pa.py_buffer(default_value * size)])
+  return pa.array(
+      np.full(size, default_value, dtype=_ArrowTypeToNpDtype(value_type)),
+      type=value_type)
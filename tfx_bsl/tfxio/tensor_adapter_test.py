@@ -17,6 +17,8 @@ from __future__ import absolute_import
 from __future__ import division
 from __future__ import print_function
 
+import unittest
+
 import numpy as np
 import six
 from tfx_bsl.pyarrow_tf import pyarrow as pa
@@ -34,11 +36,18 @@ _ALL_SUPPORTED_INT_VALUE_TYPES = [
     pa.int8(), pa.int16(), pa.int32(), pa.int64(),
     pa.uint8(), pa.uint16(), pa.uint32(), pa.uint64(),
 ]
-_ALL_SUPPORTED_FLOATING_VALUE_TYPES = [pa.float32(), pa.float64()]
+_ALL_SUPPORTED_FLOATING_VALUE_TYPES = [
+    pa.float16(), pa.float32(), pa.float64()]
 _ALL_SUPPORTED_STRING_VALUE_TYPES = [pa.binary()]
 _ALL_SUPPORTED_VALUE_TYPES = (
     _ALL_SUPPORTED_INT_VALUE_TYPES + _ALL_SUPPORTED_FLOATING_VALUE_TYPES +
     _ALL_SUPPORTED_STRING_VALUE_TYPES)
+# Test cases that run over all the value types pick their values by the kind
+# of the value type.
+_VALUE_KIND_BY_TYPE = dict(
+    [(t, "int") for t in _ALL_SUPPORTED_INT_VALUE_TYPES] +
+    [(t, "float") for t in _ALL_SUPPORTED_FLOATING_VALUE_TYPES] +
+    [(t, "bytes") for t in _ALL_SUPPORTED_STRING_VALUE_TYPES])
 _ARROW_TYPE_TO_TF_TYPE = {
     pa.int8(): tf.int8,
     pa.int16(): tf.int16,
@@ -48,6 +57,7 @@ _ARROW_TYPE_TO_TF_TYPE = {
     pa.uint16(): tf.uint16,
     pa.uint32(): tf.uint32,
     pa.uint64(): tf.uint64,
+    pa.float16(): tf.float16,
     pa.float32(): tf.float32,
     pa.float64(): tf.float64,
     pa.binary(): tf.string,
@@ -61,15 +71,79 @@ _ARROW_TYPE_TO_NP_TYPE = {
     pa.uint16(): np.dtype("uint16"),
     pa.uint32(): np.dtype("uint32"),
     pa.uint64(): np.dtype("uint64"),
+    pa.float16(): np.dtype("float16"),
     pa.float32(): np.dtype("float32"),
     pa.float64(): np.dtype("float64"),
     pa.binary(): np.dtype("object"),
 }
 
 
+def _ListArrayFromRows(rows, arrow_type):
+  """Makes a ListArray from its offsets and a flat array of all the values.
+
+  This is equivalent to pa.array(rows, type=pa.list_(arrow_type)), but the
+  values are converted in one go from a numpy array.
+
+  Args:
+    rows: a list of lists of values, or Nones for null lists.
+    arrow_type: the Arrow value type of the lists.
+  """
+  is_null = np.array([r is None for r in rows], dtype=np.bool_)
+  offsets = np.zeros(len(rows) + 1, dtype=np.int32)
+  np.cumsum([0 if r is None else len(r) for r in rows], out=offsets[1:])
+  flat_values = np.array([v for r in rows if r is not None for v in r],
+                         dtype=_ARROW_TYPE_TO_NP_TYPE[arrow_type])
+  # A null offset makes the list that starts there null.
+  return pa.ListArray.from_arrays(
+      pa.array(offsets, mask=np.append(is_null, False)),
+      pa.array(flat_values, type=arrow_type))
+
+
+def _ExpectedDenseOutput(values, arrow_type, shape):
+  """Returns a function that makes the expected dense tensor.
+
+  The expected tensor can only be made when the test runs because its type
+  depends on whether the test is run eagerly.
+
+  Args:
+    values: the (possibly nested) list of the values of the tensor.
+    arrow_type: the Arrow value type of the tensor.
+    shape: the shape of the tensor.
+  """
+  def _Make():
+    if tf.executing_eagerly():
+      return tf.constant(values, dtype=_ARROW_TYPE_TO_TF_TYPE[arrow_type],
+                         shape=shape)
+    return np.array(
+        values, dtype=_ARROW_TYPE_TO_NP_TYPE[arrow_type]).reshape(shape)
+  return _Make
+
+
+def _ExpectedVarLenSparseOutput(indices, dense_shape, values, arrow_type):
+  """Returns a function that makes the expected sparse tensor.
+
+  Args:
+    indices: an int64 numpy array of the indices of the tensor.
+    dense_shape: an int64 numpy array of the dense shape of the tensor.
+    values: the list of the values of the tensor.
+    arrow_type: the Arrow value type of the tensor.
+  """
+  def _Make():
+    if tf.executing_eagerly():
+      return tf.sparse.SparseTensor(
+          indices=indices,
+          dense_shape=dense_shape,
+          values=tf.constant(values, dtype=_ARROW_TYPE_TO_TF_TYPE[arrow_type]))
+    return tf.compat.v1.SparseTensorValue(
+        indices=indices,
+        dense_shape=dense_shape,
+        values=np.array(values, dtype=_ARROW_TYPE_TO_NP_TYPE[arrow_type]))
+  return _Make
+
+
 def _MakeDenseTensorFromListArrayTestCases():
   result = []
-  tensor_representation_textpb = """
+  tensor_representation = text_format.Parse("""
   dense_tensor {
     column_name: "input"
     shape {
@@ -78,28 +152,22 @@ def _MakeDenseTensorFromListArrayTestCases():
       }
     }
   }
-  """
+  """, schema_pb2.TensorRepresentation())
+  values_by_kind = {
+      "int": [[1, 2, 3, 4], [5, 6, 7, 8]],
+      "float": [[1.0, 2.0, 4.0, 8.0], [-1.0, -2.0, -4.0, -8.0]],
+      "bytes": [[b"a", b"b", b"c", b"d"], [b"e", b"f", b"g", b"h"]],
+  }
   for t in _ALL_SUPPORTED_VALUE_TYPES:
     expected_type_spec = tf.TensorSpec([None, 4], _ARROW_TYPE_TO_TF_TYPE[t])
-
-    if pa.types.is_integer(t):
-      values = [[1, 2, 3, 4], [5, 6, 7, 8]]
-    elif pa.types.is_floating(t):
-      values = [[1.0, 2.0, 4.0, 8.0], [-1.0, -2.0, -4.0, -8.0]]
-    else:
-      values = [[b"a", b"b", b"c", b"d"], [b"e", b"f", b"g", b"h"]]
-
-    arrow_array = pa.array(values, type=pa.list_(t))
-    if tf.executing_eagerly():
-      expected_output = tf.constant(values, dtype=_ARROW_TYPE_TO_TF_TYPE[t])
-    else:
-      expected_output = np.array(values, dtype=_ARROW_TYPE_TO_NP_TYPE[t])
+    values = values_by_kind[_VALUE_KIND_BY_TYPE[t]]
+    arrow_array = _ListArrayFromRows(values, t)
 
     result.append({
         "testcase_name": "dense_from_list_array_{}".format(t),
-        "tensor_representation_textpb": tensor_representation_textpb,
+        "tensor_representation": tensor_representation,
         "arrow_array": arrow_array,
-        "expected_output": expected_output,
+        "make_expected_output": _ExpectedDenseOutput(values, t, (2, 4)),
         "expected_type_spec": expected_type_spec,
     })
 
@@ -107,7 +175,7 @@ def _MakeDenseTensorFromListArrayTestCases():
 
 
 def _MakeIntDefaultFilledDenseTensorFromListArrayTestCases():
-  tensor_representation_textpb = """
+  tensor_representation = text_format.Parse("""
   dense_tensor {
     column_name: "input"
     shape {
@@ -122,24 +190,16 @@ def _MakeIntDefaultFilledDenseTensorFromListArrayTestCases():
       int_value: 2
     }
   }
-  """
+  """, schema_pb2.TensorRepresentation())
   result = []
   for t in _ALL_SUPPORTED_INT_VALUE_TYPES:
-    arrow_array = pa.array([None, [1, 2, 3, 4], None], type=pa.list_(t))
-    if tf.executing_eagerly():
-      expected_output = tf.constant(
-          [[2, 2, 2, 2], [1, 2, 3, 4], [2, 2, 2, 2]],
-          dtype=_ARROW_TYPE_TO_TF_TYPE[t],
-          shape=(3, 2, 2))
-    else:
-      expected_output = np.array(
-          [2, 2, 2, 2, 1, 2, 3, 4, 2, 2, 2, 2],
-          dtype=_ARROW_TYPE_TO_NP_TYPE[t]).reshape((3, 2, 2))
+    arrow_array = _ListArrayFromRows([None, [1, 2, 3, 4], None], t)
     result.append({
         "testcase_name": "default_filled_dense_from_list_array_{}".format(t),
-        "tensor_representation_textpb": tensor_representation_textpb,
+        "tensor_representation": tensor_representation,
         "arrow_array": arrow_array,
-        "expected_output": expected_output,
+        "make_expected_output": _ExpectedDenseOutput(
+            [2, 2, 2, 2, 1, 2, 3, 4, 2, 2, 2, 2], t, (3, 2, 2)),
         "expected_type_spec": tf.TensorSpec([None, 2, 2],
                                             _ARROW_TYPE_TO_TF_TYPE[t])
     })
@@ -147,7 +207,7 @@ def _MakeIntDefaultFilledDenseTensorFromListArrayTestCases():
 
 
 def _MakeFloatingDefaultFilledDenseTensorFromListArrayTestCases():
-  tensor_representation_textpb = """
+  tensor_representation = text_format.Parse("""
   dense_tensor {
     column_name: "input"
     shape {
@@ -162,23 +222,16 @@ def _MakeFloatingDefaultFilledDenseTensorFromListArrayTestCases():
       float_value: -1
     }
   }
-  """
+  """, schema_pb2.TensorRepresentation())
   result = []
   for t in _ALL_SUPPORTED_FLOATING_VALUE_TYPES:
-    arrow_array = pa.array([None, [1, 2], None], type=pa.list_(t))
-    if tf.executing_eagerly():
-      expected_output = tf.constant([[-1, -1], [1, 2], [-1, -1]],
-                                    dtype=_ARROW_TYPE_TO_TF_TYPE[t],
-                                    shape=(3, 2, 1))
-    else:
-      expected_output = np.array(
-          [-1, -1, 1, 2, -1, -1],
-          dtype=_ARROW_TYPE_TO_NP_TYPE[t]).reshape((3, 2, 1))
+    arrow_array = _ListArrayFromRows([None, [1, 2], None], t)
     result.append({
         "testcase_name": "default_filled_dense_from_list_array_{}".format(t),
-        "tensor_representation_textpb": tensor_representation_textpb,
+        "tensor_representation": tensor_representation,
         "arrow_array": arrow_array,
-        "expected_output": expected_output,
+        "make_expected_output": _ExpectedDenseOutput(
+            [-1, -1, 1, 2, -1, -1], t, (3, 2, 1)),
         "expected_type_spec": tf.TensorSpec([None, 2, 1],
                                             dtype=_ARROW_TYPE_TO_TF_TYPE[t])
     })
@@ -186,7 +239,7 @@ def _MakeFloatingDefaultFilledDenseTensorFromListArrayTestCases():
 
 
 def _MakeStringDefaultFilledDenseTensorFromListArrayTestCases():
-  tensor_representation_textpb = """
+  tensor_representation = text_format.Parse("""
   dense_tensor {
     column_name: "input"
     shape {
@@ -195,65 +248,52 @@ def _MakeStringDefaultFilledDenseTensorFromListArrayTestCases():
       bytes_value: "nil"
     }
   }
-  """
+  """, schema_pb2.TensorRepresentation())
   result = []
   for t in _ALL_SUPPORTED_STRING_VALUE_TYPES:
-    arrow_array = pa.array([None, ["hello"], None], type=pa.list_(t))
-    if tf.executing_eagerly():
-      expected_output = tf.constant(["nil", "hello", "nil"],
-                                    dtype=_ARROW_TYPE_TO_TF_TYPE[t])
-    else:
-      expected_output = np.array([b"nil", b"hello", b"nil"],
-                                 dtype=_ARROW_TYPE_TO_NP_TYPE[t])
+    arrow_array = _ListArrayFromRows([None, ["hello"], None], t)
     result.append({
         "testcase_name": "default_filled_dense_from_list_array_{}".format(t),
-        "tensor_representation_textpb": tensor_representation_textpb,
+        "tensor_representation": tensor_representation,
         "arrow_array": arrow_array,
-        "expected_output": expected_output,
+        "make_expected_output": _ExpectedDenseOutput(
+            [b"nil", b"hello", b"nil"], t, (3,)),
         "expected_type_spec": tf.TensorSpec([None], _ARROW_TYPE_TO_TF_TYPE[t])
     })
   return result
 
 
 def _MakeVarLenSparseTensorFromListArrayTestCases():
-  tensor_representation_textpb = """
+  tensor_representation = text_format.Parse("""
   varlen_sparse_tensor {
     column_name: "input"
   }
-  """
+  """, schema_pb2.TensorRepresentation())
+  # The same for all the value types.
+  expected_sparse_indices = np.array([[0, 0], [0, 1], [2, 0], [4, 0]],
+                                     dtype=np.int64)
+  expected_dense_shape = np.array([5, 2], dtype=np.int64)
+  # (values, expected_values) by value kind.
+  values_by_kind = {
+      "int": ([[1, 2], None, [3], [], [5]], [1, 2, 3, 5]),
+      "float": ([[1.0, 2.0], None, [3.0], [], [5.0]], [1.0, 2.0, 3.0, 5.0]),
+      "bytes": ([["a", "b"], None, ["c"], [], ["d"]],
+                [b"a", b"b", b"c", b"d"]),
+  }
   result = []
   for t in _ALL_SUPPORTED_VALUE_TYPES:
-    if pa.types.is_integer(t):
-      values = [[1, 2], None, [3], [], [5]]
-      expected_values = [1, 2, 3, 5]
-    elif pa.types.is_floating(t):
-      values = [[1.0, 2.0], None, [3.0], [], [5.0]]
-      expected_values = [1.0, 2.0, 3.0, 5.0]
-    else:
-      values = [["a", "b"], None, ["c"], [], ["d"]]
-      expected_values = [b"a", b"b", b"c", b"d"]
-    expected_sparse_indices = [[0, 0], [0, 1], [2, 0], [4, 0]]
-    expected_dense_shape = [5, 2]
-    if tf.executing_eagerly():
-      expected_output = tf.sparse.SparseTensor(
-          indices=expected_sparse_indices,
-          dense_shape=expected_dense_shape,
-          values=tf.constant(expected_values,
-                             dtype=_ARROW_TYPE_TO_TF_TYPE[t]))
-    else:
-      expected_output = tf.compat.v1.SparseTensorValue(
-          indices=np.array(expected_sparse_indices, dtype=np.int64),
-          dense_shape=np.array(expected_dense_shape, dtype=np.int64),
-          values=np.array(expected_values, dtype=_ARROW_TYPE_TO_NP_TYPE[t]))
+    values, expected_values = values_by_kind[_VALUE_KIND_BY_TYPE[t]]
     result.append({
         "testcase_name":
             "varlen_sparse_from_list_array_{}".format(t),
-        "tensor_representation_textpb":
-            tensor_representation_textpb,
+        "tensor_representation":
+            tensor_representation,
         "arrow_array":
-            pa.array(values, type=pa.list_(t)),
-        "expected_output":
-            expected_output,
+            _ListArrayFromRows(values, t),
+        "make_expected_output":
+            _ExpectedVarLenSparseOutput(expected_sparse_indices,
+                                        expected_dense_shape, expected_values,
+                                        t),
         "expected_type_spec":
             tf.SparseTensorSpec(tf.TensorShape([None, None]),
                                 _ARROW_TYPE_TO_TF_TYPE[t])
@@ -305,12 +345,10 @@ class TensorAdapterTest(parameterized.TestCase, tf.test.TestCase):
 
   @parameterized.named_parameters(*_ONE_TENSOR_TEST_CASES)
   @test_util.run_in_graph_and_eager_modes
-  def testOneTensorFromOneColumn(self, tensor_representation_textpb,
+  def testOneTensorFromOneColumn(self, tensor_representation,
                                  arrow_array, expected_type_spec,
-                                 expected_output):
+                                 make_expected_output):
 
-    tensor_representation = text_format.Parse(tensor_representation_textpb,
-                                              schema_pb2.TensorRepresentation())
     column_name = None
     if tensor_representation.HasField("dense_tensor"):
       column_name = tensor_representation.dense_tensor.column_name
@@ -326,6 +364,7 @@ class TensorAdapterTest(parameterized.TestCase, tf.test.TestCase):
     self.assertLen(converted, 1)
     self.assertIn("output", converted)
     actual_output = converted["output"]
+    expected_output = make_expected_output()
     if tf.executing_eagerly():
       self.assertTrue(
           expected_type_spec.is_compatible_with(actual_output),
@@ -460,6 +499,192 @@ class TensorAdapterTest(parameterized.TestCase, tf.test.TestCase):
             spec.is_compatible_with(tensors[name]),
             "{} is not compatible with spec {}".format(tensors[name], spec))
 
+  @test_util.run_in_graph_and_eager_modes
+  def testDenseTensorFromSlicedListArray(self):
+    record_batch = pa.RecordBatch.from_arrays([
+        pa.array([[1, 2], [3, 4], [5, 6], [7, 8]],
+                 type=pa.list_(pa.int64())).slice(1, 2),
+    ], ["input"])
+    tensor_representation = text_format.Parse(
+        """
+        dense_tensor {
+          column_name: "input"
+          shape {
+            dim {
+              size: 2
+            }
+          }
+        }
+        """, schema_pb2.TensorRepresentation())
+    adapter = tensor_adapter.TensorAdapter(
+        tensor_adapter.TensorAdapterConfig(
+            record_batch.schema, {"output": tensor_representation}))
+    self.assertAllEqual(
+        np.array([[3, 4], [5, 6]], dtype=np.int64),
+        adapter.ToBatchTensors(record_batch)["output"])
+
+  @test_util.run_in_graph_and_eager_modes
+  def testDefaultFilledDenseTensorFromSlicedListArray(self):
+    tensor_representation = text_format.Parse(
+        """
+        dense_tensor {
+          column_name: "input"
+          shape {
+            dim {
+              size: 2
+            }
+          }
+          default_value {
+            float_value: -1
+          }
+        }
+        """, schema_pb2.TensorRepresentation())
+    list_array = pa.array([[1, 2], None, [3, 4], [5, 6]],
+                          type=pa.list_(pa.float32()))
+    for sliced, expected in [
+        (list_array.slice(1, 2), [[-1, -1], [3, 4]]),
+        # No null to fill.
+        (list_array.slice(2), [[3, 4], [5, 6]]),
+    ]:
+      record_batch = pa.RecordBatch.from_arrays([sliced], ["input"])
+      adapter = tensor_adapter.TensorAdapter(
+          tensor_adapter.TensorAdapterConfig(
+              record_batch.schema, {"output": tensor_representation}))
+      self.assertAllEqual(
+          np.array(expected, dtype=np.float32),
+          adapter.ToBatchTensors(record_batch)["output"])
+
+  @unittest.skipIf(not hasattr(pa.types, "is_fixed_size_list"),
+                   "FixedSizeListArrays require pyarrow>=0.16")
+  @test_util.run_in_graph_and_eager_modes
+  def testDenseTensorFromFixedSizeListArray(self):
+    record_batch = pa.RecordBatch.from_arrays([
+        pa.array([[1, 2], [3, 4], [5, 6], [7, 8]],
+                 type=pa.list_(pa.int32(), 2)).slice(1),
+        pa.array([[1, 2], None, [5, 6], None],
+                 type=pa.list_(pa.float32(), 2)).slice(0, 3),
+    ], ["int_fixed", "float_fixed_with_nulls"])
+    tensor_representations = {
+        "int_dense":
+            text_format.Parse(
+                """
+        dense_tensor {
+          column_name: "int_fixed"
+          shape {
+            dim {
+              size: 2
+            }
+          }
+        }
+        """, schema_pb2.TensorRepresentation()),
+        "float_default_filled_dense":
+            text_format.Parse(
+                """
+        dense_tensor {
+          column_name: "float_fixed_with_nulls"
+          shape {
+            dim {
+              size: 2
+            }
+            dim {
+              size: 1
+            }
+          }
+          default_value {
+            float_value: -1
+          }
+        }
+        """, schema_pb2.TensorRepresentation()),
+    }
+    adapter = tensor_adapter.TensorAdapter(
+        tensor_adapter.TensorAdapterConfig(
+            record_batch.schema, tensor_representations))
+    tensors = adapter.ToBatchTensors(record_batch)
+    self.assertAllEqual(
+        np.array([[3, 4], [5, 6], [7, 8]], dtype=np.int32),
+        tensors["int_dense"])
+    self.assertAllEqual(
+        np.array([[[1], [2]], [[-1], [-1]], [[5], [6]]], dtype=np.float32),
+        tensors["float_default_filled_dense"])
+
+  @unittest.skipIf(not hasattr(pa.types, "is_fixed_size_list"),
+                   "FixedSizeListArrays require pyarrow>=0.16")
+  def testRaiseOnNullValuesInDefaultFilledFixedSizeListArray(self):
+    record_batch = pa.RecordBatch.from_arrays([
+        pa.array([[1, None], None], type=pa.list_(pa.int64(), 2)),
+    ], ["input"])
+    tensor_representation = text_format.Parse(
+        """
+        dense_tensor {
+          column_name: "input"
+          shape {
+            dim {
+              size: 2
+            }
+          }
+          default_value {
+            int_value: 7
+          }
+        }
+        """, schema_pb2.TensorRepresentation())
+    adapter = tensor_adapter.TensorAdapter(
+        tensor_adapter.TensorAdapterConfig(
+            record_batch.schema, {"output": tensor_representation}))
+    with self.assertRaisesRegexp(ValueError,
+                                 "non-null lists contain null values"):
+      adapter.ToBatchTensors(record_batch)
+
+  @parameterized.named_parameters(
+      ("with_max_batch_size", 2),
+      ("without_max_batch_size", None),
+  )
+  @test_util.run_in_graph_and_eager_modes
+  def testToBatchTensorsInto(self, max_batch_size):
+    schema = pa.schema([pa.field("input", pa.list_(pa.int64()))])
+    tensor_representation = text_format.Parse(
+        """
+        dense_tensor {
+          column_name: "input"
+          shape {
+            dim {
+              size: 2
+            }
+          }
+          default_value {
+            int_value: -1
+          }
+        }
+        """, schema_pb2.TensorRepresentation())
+    adapter = tensor_adapter.TensorAdapter(
+        tensor_adapter.TensorAdapterConfig(
+            schema, {"output": tensor_representation},
+            max_batch_size=max_batch_size))
+    tensors = {}
+    outputs = []
+    for values, expected in [
+        ([[1, 2], None], [[1, 2], [-1, -1]]),
+        ([None, [3, 4]], [[-1, -1], [3, 4]]),
+        # Larger than max_batch_size.
+        ([None, [5, 6], None], [[-1, -1], [5, 6], [-1, -1]]),
+        ([None, [7, 8]], [[-1, -1], [7, 8]]),
+    ]:
+      record_batch = pa.RecordBatch.from_arrays(
+          [pa.array(values, type=pa.list_(pa.int64()))], ["input"])
+      result = adapter.ToBatchTensorsInto(record_batch, tensors)
+      self.assertIs(tensors, result)
+      self.assertLen(tensors, 1)
+      self.assertAllEqual(np.array(expected, dtype=np.int64),
+                          tensors["output"])
+      outputs.append(tensors["output"])
+
+    if not tf.executing_eagerly():
+      # Batches that fit are filled into the same buffer, if there is one.
+      self.assertEqual(max_batch_size is not None,
+                       np.shares_memory(outputs[0], outputs[1]))
+      self.assertEqual(max_batch_size is not None,
+                       np.shares_memory(outputs[1], outputs[3]))
+      self.assertFalse(np.shares_memory(outputs[1], outputs[2]))
+
   def testRaiseOnUnsupportedTensorRepresentation(self):
     with self.assertRaisesRegexp(ValueError, "Unable to handle tensor"):
       tensor_adapter.TensorAdapter(
@@ -485,6 +710,46 @@ class TensorAdapterTest(parameterized.TestCase, tf.test.TestCase):
                   """, schema_pb2.TensorRepresentation())
               }))
 
+  @parameterized.named_parameters(
+      ("missing_column", ["a"]),
+      ("duplicated_column", ["x", "x", "a"]),
+  )
+  def testRaiseOnColumnNotFoundOnce(self, column_names):
+    for rep_textpb in ["""
+        dense_tensor {
+          column_name: "x"
+          shape: {}
+        }""", """
+        varlen_sparse_tensor {
+          column_name: "x"
+        }"""]:
+      with self.assertRaisesRegexp(ValueError, "Unable to handle tensor"):
+        tensor_adapter.TensorAdapter(
+            tensor_adapter.TensorAdapterConfig(
+                pa.schema([pa.field(n, pa.list_(pa.int64()))
+                           for n in column_names]),
+                {"tensor": text_format.Parse(
+                    rep_textpb, schema_pb2.TensorRepresentation())}))
+
+  def testRaiseOnSchemaMismatch(self):
+    tensor_representation = text_format.Parse(
+        """
+        varlen_sparse_tensor {
+          column_name: "column"
+        }
+        """, schema_pb2.TensorRepresentation())
+    adapter = tensor_adapter.TensorAdapter(
+        tensor_adapter.TensorAdapterConfig(
+            pa.schema([pa.field("column", pa.list_(pa.int64()))]),
+            {"tensor": tensor_representation}))
+    # RecordBatches of distinct but equal schema objects are accepted.
+    for _ in range(2):
+      adapter.ToBatchTensors(pa.RecordBatch.from_arrays(
+          [pa.array([[1]], type=pa.list_(pa.int64()))], ["column"]))
+    with self.assertRaisesRegexp(ValueError, "Expected same schema"):
+      adapter.ToBatchTensors(pa.RecordBatch.from_arrays(
+          [pa.array([[1]], type=pa.list_(pa.int32()))], ["column"]))
+
   @parameterized.named_parameters(*_INVALID_DEFAULT_VALUE_TEST_CASES)
   def testRaiseOnInvalidDefaultValue(self, value_type, default_value_pbtxt,
                                      exception_regexp):